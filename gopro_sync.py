@@ -12,18 +12,30 @@ import sys
 import time
 import shutil
 import logging
+import logging.handlers
 import subprocess
+import threading
+import queue
+import tempfile
 import re
 from pathlib import Path
 from datetime import datetime
 import argparse
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 import gi
 gi.require_version('Notify', '0.7')
 from gi.repository import Notify
+try:
+    import pyudev
+except ImportError:  # Fall back to polling sysfs
+    pyudev = None
 
 # Configuration
 DEST_DIR = "/Zdir/GoPro"
-LOG_FILE = "~/gopro_sync.log"
+LOG_FILE = os.path.expanduser("~/gopro_sync.log")
+LOG_MAX_BYTES = 1_000_000
+LOG_BACKUP_COUNT = 3
 CHECK_INTERVAL = 5  # seconds
 # Sound file to play when operation completes successfully
 SUCCESS_SOUND = "/usr/share/sounds/freedesktop/stereo/complete.oga"
@@ -33,12 +45,43 @@ GOPRO_VENDOR_ID = "2672"
 GOPRO_PRODUCT_ID = "0059"
 GOPRO_MODEL = "HERO12 Black"
 
+# The user and GVFS root don't change while the script runs, so resolve them once
+_UID = os.getuid()
+_GVFS_PATH = Path(f"/run/user/{_UID}/gvfs")
+
+# Matches GVFS mount directory names that may belong to the GoPro
+_GVFS_RE = re.compile(r'gopro|mtp|' + re.escape(GOPRO_VENDOR_ID) + r'|' + re.escape(GOPRO_PRODUCT_ID), re.IGNORECASE)
+
+# Kernel view of attached USB devices (idVendor/idProduct are lowercase hex)
+USB_SYSFS_PATH = "/sys/bus/usb/devices"
+
+# Buffer size for the userspace copy fallback (e.g. when reading from GVFS/MTP)
+COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Maximum number of discovered files waiting for a transfer worker
+WORK_QUEUE_SIZE = 256
+
+# Granularity (seconds) for caching date subdirectory names. Every UTC offset and DST
+# transition falls on a 15-minute boundary, so all mtimes in one bucket share a local date.
+DATE_BUCKET_SECONDS = 15 * 60
+
+def positive_int(value):
+    """argparse type for options that must be a positive integer."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+    return number
+
 # Set up argument parsing
 parser = argparse.ArgumentParser(description="GoPro Auto Sync Tool")
 parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose output")
 parser.add_argument("--move", action="store_true", help="Move files instead of copying")
 parser.add_argument("--sound", type=str, default=SUCCESS_SOUND, help="Path to sound file to play on success")
 parser.add_argument("--no-notify", action="store_true", help="Disable desktop notifications")
+parser.add_argument("--threads", type=positive_int, default=8, help="Number of files to transfer in parallel")
 args = parser.parse_args()
 
 # Set up logging based on verbosity
@@ -47,54 +90,78 @@ logging.basicConfig(
     level=log_level,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(LOG_FILE),
+        logging.handlers.RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger("gopro_sync")
 
+# Connect to the notification service once for the whole run
+if not args.no_notify:
+    Notify.init("GoPro Auto Sync Tool")
+    atexit.register(Notify.uninit)
+
+def _read_sysfs_attr(path):
+    """Read a single-line sysfs attribute."""
+    with open(path) as f:
+        return f.read().strip()
+
+def _usb_has(vendor_id, product_id):
+    """Check sysfs for an attached USB device with the given vendor and product ID."""
+    vendor_id = vendor_id.lower()
+    product_id = product_id.lower()
+    try:
+        entries = os.scandir(USB_SYSFS_PATH)
+    except OSError:
+        return False
+    with entries:
+        for entry in entries:
+            try:
+                if (_read_sysfs_attr(f"{entry.path}/idVendor").lower() == vendor_id and
+                        _read_sysfs_attr(f"{entry.path}/idProduct").lower() == product_id):
+                    return True
+            except OSError:
+                # Interfaces and hubs without these attributes
+                continue
+    return False
+
 def find_gopro_gvfs_mount():
     """Find the GoPro mount point under GVFS by listing its contents."""
-    user_id = os.getuid()
-    gvfs_path = Path(f"/run/user/{user_id}/gvfs")
+    gvfs_path = _GVFS_PATH
     if gvfs_path.exists():
-        if args.verbose:
-            logger.debug(f"Listing contents of {gvfs_path}")
+        logger.debug("Listing contents of %s", gvfs_path)
         for item in gvfs_path.iterdir():
-            if args.verbose:
-                logger.debug(f"Found item in GVFS: {item}")
-            if "gopro" in str(item).lower() or GOPRO_VENDOR_ID in str(item).lower() or GOPRO_PRODUCT_ID in str(item).lower() or "mtp" in str(item).lower():
-                potential_mount_point = gvfs_path / item
+            logger.debug("Found item in GVFS: %s", item)
+            # Match on the entry name only; the full path includes the uid, which could contain an ID
+            if _GVFS_RE.search(item.name):
+                potential_mount_point = item
                 if potential_mount_point.is_dir():
                     if args.verbose:
                         logger.info(f"Potential GoPro GVFS mount found: {potential_mount_point}")
                     return str(potential_mount_point)
                 else:
                     # It might be a gvfs control file, so we continue searching
-                    if args.verbose:
-                        logger.debug(f"{potential_mount_point} is not a directory.")
+                    logger.debug("%s is not a directory.", potential_mount_point)
     return None
 
 def is_gopro_connected():
     """Check if a GoPro camera is connected and return its mount point if found."""
     # Method 1: Check USB devices for GoPro VENDOR_ID and PRODUCT_ID
-    result = subprocess.run(['lsusb'], capture_output=True, text=True)
-    for line in result.stdout.split('\n'):
-        if GOPRO_VENDOR_ID in line and GOPRO_PRODUCT_ID in line:
+    if _usb_has(GOPRO_VENDOR_ID, GOPRO_PRODUCT_ID):
+        if args.verbose:
+            logger.info(f"GoPro camera detected via sysfs: {GOPRO_VENDOR_ID}:{GOPRO_PRODUCT_ID}")
+        # If detected, now try to find the mount point via GVFS
+        mount_point = find_gopro_gvfs_mount()
+        if mount_point:
+            return mount_point
+        else:
             if args.verbose:
-                logger.info(f"GoPro camera detected via lsusb: {line.strip()}")
-            # If detected, now try to find the mount point via GVFS
-            mount_point = find_gopro_gvfs_mount()
-            if mount_point:
-                return mount_point
+                logger.info("GoPro detected, attempting to find mount point...")
+            found_mount = find_gopro_mount_point()
+            if found_mount:
+                return found_mount
             else:
-                if args.verbose:
-                    logger.info("GoPro detected, attempting to find mount point...")
-                found_mount = find_gopro_mount_point()
-                if found_mount:
-                    return found_mount
-                else:
-                    return None
+                return None
     return None
 
 def find_gopro_mount_point():
@@ -118,10 +185,8 @@ def get_device_info():
         mtp_info = subprocess.run(['lsusb', '-v'], capture_output=True, text=True).stdout
         gvfs_info_gio = ""
         gvfs_list = ""
-        user_id = os.getuid()
-        gvfs_path_str = f"/run/user/{user_id}/gvfs/"
-        gvfs_path = Path(gvfs_path_str)
-        if gvfs_path.exists():
+        gvfs_path_str = f"{_GVFS_PATH}/"
+        if _GVFS_PATH.exists():
             try:
                 gvfs_list_output = subprocess.run(['ls', '-la', gvfs_path_str], capture_output=True, text=True).stdout
                 gvfs_list = f"Contents of {gvfs_path_str}:\n{gvfs_list_output}"
@@ -137,8 +202,8 @@ def get_device_info():
             gvfs_info_gio = f"Error running gio mount -l: {e}"
 
         # Get the latest dmesg logs related to GoPro
-        dmesg_logs = subprocess.run(['dmesg', '|', 'grep', '-i', 'gopro', '|', 'tail', '-n', '20'],
-                                     shell=True, capture_output=True, text=True).stdout
+        dmesg_output = subprocess.run(['dmesg', '--ctime'], capture_output=True, text=True).stdout
+        dmesg_logs = '\n'.join([line for line in dmesg_output.splitlines() if 'gopro' in line.lower()][-20:])
 
         return {
             'mount': mount_info,
@@ -156,9 +221,6 @@ def get_device_info():
 def send_desktop_notification(summary, body, icon="camera-photo"):
     """Send a desktop notification to the Ubuntu notification system."""
     try:
-        # Initialize the notification system
-        Notify.init("GoPro Auto Sync Tool")
-        
         # Create the notification
         notification = Notify.Notification.new(
             summary,
@@ -169,130 +231,313 @@ def send_desktop_notification(summary, body, icon="camera-photo"):
         # Show the notification
         notification.show()
         logger.debug("Desktop notification sent")
-        
-        # Clean up
-        Notify.uninit()
         return True
     except Exception as e:
         logger.warning(f"Failed to send desktop notification: {e}")
         return False
 
+# Audio players to try for the success sound, in order of preference
+AUDIO_PLAYERS = [
+    'paplay',   # PulseAudio
+    'aplay',    # ALSA
+    'play',     # SoX
+    'mpg123',   # MPG123
+    'mplayer'   # MPlayer
+]
+_audio_player = None
+
+def _find_audio_player():
+    """Return the path of the first available audio player, or None."""
+    global _audio_player
+    if _audio_player is None:
+        for name in AUDIO_PLAYERS:
+            _audio_player = shutil.which(name)
+            if _audio_player:
+                break
+    return _audio_player
+
 def play_success_sound():
     """Play a sound to indicate successful completion."""
     if os.path.exists(args.sound):
         try:
-            # Try to play using various common audio players
-            players = [
-                ['paplay', args.sound],  # PulseAudio
-                ['aplay', args.sound],   # ALSA
-                ['play', args.sound],    # SoX
-                ['mpg123', args.sound],  # MPG123
-                ['mplayer', args.sound]  # MPlayer
-            ]
-            
-            for player in players:
-                try:
-                    subprocess.run(player, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    logger.debug(f"Successfully played sound using {player[0]}")
-                    return
-                except (subprocess.SubprocessError, FileNotFoundError):
-                    continue
-                    
-            logger.warning(f"Could not play success sound: No suitable audio player found")
+            player = _find_audio_player()
+            if not player:
+                logger.warning(f"Could not play success sound: No suitable audio player found")
+                return
+
+            # Wait for playback: the script exits right after, and a oneshot systemd unit
+            # would kill a still-running player along with the rest of its cgroup
+            subprocess.run([player, args.sound], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            logger.debug("Successfully played sound using %s", os.path.basename(player))
         except Exception as e:
             logger.warning(f"Failed to play success sound: {e}")
     else:
         logger.warning(f"Success sound file not found: {args.sound}")
 
+def _iter_files(root):
+    """Recursively yield os.DirEntry objects for the regular files under root.
+
+    Like os.walk, directories that can't be listed are skipped rather than aborting the scan.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError as e:
+        logger.warning(f"Skipping unreadable directory {root}: {e}")
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+def _kernel_copy(src_fd, dst_fd, blocksize):
+    """Copy src_fd to dst_fd until EOF inside the kernel, blocksize bytes per call.
+
+    Tries copy_file_range (which can reflink on Btrfs/XFS) and then sendfile.
+    Returns False if neither is supported for this pair of files.
+    """
+    for method in ("copy_file_range", "sendfile"):
+        offset = 0
+        try:
+            while True:
+                if method == "copy_file_range":
+                    sent = os.copy_file_range(src_fd, dst_fd, blocksize, offset, offset)
+                else:
+                    sent = os.sendfile(dst_fd, src_fd, offset, blocksize)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            # A failure part way through is a real I/O error, not an unsupported filesystem
+            if offset:
+                raise
+            continue
+        # Nothing copied on the first call: either an empty file or a filesystem (e.g. FUSE with
+        # a stale size) that doesn't support this call. Let the caller read to EOF itself.
+        if offset:
+            return True
+    return False
+
+def _fast_copy(src, dst):
+    """Drop-in replacement for shutil.copy2 that avoids the userspace bounce buffer when possible.
+
+    The data goes to a temporary file next to dst that is only renamed into place once
+    complete, so an interrupted transfer never leaves a truncated dst behind.
+    """
+    tmp_fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(dst)}.", suffix=".part",
+                                        dir=os.path.dirname(dst))
+    try:
+        with open(tmp_fd, 'wb') as fdst, open(src, 'rb') as fsrc:
+            # The reported size only sizes the chunks; the copy always runs to EOF
+            blocksize = max(os.fstat(fsrc.fileno()).st_size, COPY_BUFFER_SIZE)
+            if not _kernel_copy(fsrc.fileno(), fdst.fileno(), blocksize):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        shutil.copystat(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return dst
+
+# mtime bucket -> "MM-DD-YYYY"
+_date_cache = {}
+
+def _date_str(mtime):
+    """Return the local MM-DD-YYYY date for an mtime, formatting each bucket only once."""
+    key = int(mtime // DATE_BUCKET_SECONDS)
+    date_str = _date_cache.get(key)
+    if date_str is None:
+        date_str = datetime.fromtimestamp(mtime).strftime("%m-%d-%Y")
+        _date_cache[key] = date_str
+    return date_str
+
+def _move_one(src_path, src_stat, dest_subdir):
+    """Move a single file into its date subdirectory and return its size.
+
+    src_stat and dest_subdir come from the enumeration pass, so nothing is re-stat'ed
+    or re-formatted here.
+    """
+    name = os.path.basename(src_path)
+    logger.debug("Moving: %s to %s", name, dest_subdir)
+    # shutil.move renames when it can and only falls back to copying across filesystems
+    shutil.move(src_path, os.path.join(dest_subdir, name), copy_function=_fast_copy)
+    return src_stat.st_size
+
+def _copy_one(src_path, src_stat, dest_subdir):
+    """Copy a single file into its date subdirectory and return its size."""
+    name = os.path.basename(src_path)
+    logger.debug("Copying: %s to %s", name, dest_subdir)
+    _fast_copy(src_path, os.path.join(dest_subdir, name))
+    return src_stat.st_size
+
 def copy_or_move_files(source_dir):
     """Copy or move new files from the GoPro to the destination directory,
     organized by the file's modification date (MM-DD-YYYY)."""
+    # Counters live outside the try so a failure part way through still reports what was transferred
+    total_new_files = 0
+    processed_new_files = 0
+    total_size_processed = 0
     try:
         # Make sure the destination directory exists
         os.makedirs(DEST_DIR, exist_ok=True)
 
-        files_to_process = []
-        for root, _, files in os.walk(source_dir):
-            for file in files:
-                src_path = os.path.join(root, file)
-                mtime = os.path.getmtime(src_path)
-                date_obj = datetime.fromtimestamp(mtime)
-                date_subdir_name = date_obj.strftime("%m-%d-%Y")
-                dest_subdir = os.path.join(DEST_DIR, date_subdir_name)
-                dest_path = os.path.join(dest_subdir, os.path.basename(src_path))
-                if not os.path.exists(dest_path):
-                    files_to_process.append(src_path)
-
-        total_new_files = len(files_to_process)
-        if args.verbose:
-            logger.info(f"Found {sum([len(f) for r, d, f in os.walk(source_dir)])} files to process.") # Show total in source
-        logger.info(f"### {total_new_files} new files found ###")
-
-        processed_new_files = 0
-        total_size_processed = 0
-
-        for i, src_path in enumerate(files_to_process):
+        # Enumeration (one MTP round-trip per file) and transfers overlap: this thread scans
+        # the source and queues new files while the pool workers copy them.
+        work_queue = queue.Queue(maxsize=WORK_QUEUE_SIZE)
+        progress_lock = threading.Lock()
+        action = "Moved" if args.move else "Copied"
+        # Choose the transfer function once rather than branching on --move per file
+        process_one = _move_one if args.move else _copy_one
+        num_workers = args.threads
+        total_source_files = 0
+        created_subdirs = set()
+        # Destination paths already handed to a worker. Two source folders (e.g. 100GOPRO and
+        # 101GOPRO) can hold files with the same name and date, and two workers must never
+        # write the same file at once.
+        queued_dest_paths = set()
+
+        def transfer_worker():
+            nonlocal processed_new_files, total_size_processed
+            while True:
+                item = work_queue.get()
+                if item is None:
+                    return
+                src_path, st, dest_subdir = item
+                try:
+                    file_size = process_one(src_path, st, dest_subdir)
+                except Exception as e:
+                    logger.error(f"Error processing {src_path}: {e}")
+                    continue
+                with progress_lock:
+                    processed_new_files += 1
+                    total_size_processed += file_size
+                    if processed_new_files % 10 == 0:
+                        logger.info(f"Progress: {processed_new_files}/{total_new_files} files {action} ({total_size_processed / (1024*1024):.2f} MB)")
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            workers = [executor.submit(transfer_worker) for _ in range(num_workers)]
+            # Bind hot-loop lookups to locals; this loop runs once per file on the card
+            join = os.path.join
+            exists = os.path.exists
+            date_str = _date_str
+            put = work_queue.put
             try:
-                mtime = os.path.getmtime(src_path)
-                date_obj = datetime.fromtimestamp(mtime)
-                date_subdir_name = date_obj.strftime("%m-%d-%Y")
-                dest_subdir = os.path.join(DEST_DIR, date_subdir_name)
-                os.makedirs(dest_subdir, exist_ok=True)
-                dest_path = os.path.join(dest_subdir, os.path.basename(src_path))
-
-                if args.move:
-                    if args.verbose:
-                        logger.debug(f"Moving: {os.path.basename(src_path)} to {dest_subdir}")
-                    shutil.move(src_path, dest_path)
-                else:
-                    if args.verbose:
-                        logger.debug(f"Copying: {os.path.basename(src_path)} to {dest_subdir}")
-                    shutil.copy2(src_path, dest_path)
+                # Single scandir pass: DirEntry.stat() is cached, so each file costs one stat round-trip
+                for entry in _iter_files(source_dir):
+                    total_source_files += 1
+                    st = entry.stat()
+                    dest_subdir = join(DEST_DIR, date_str(st.st_mtime))
+                    dest_path = join(dest_subdir, entry.name)
+                    if dest_path in queued_dest_paths:
+                        logger.warning(f"Skipping {entry.path}: another file is already being transferred to {dest_path}")
+                        continue
+                    if not exists(dest_path):
+                        queued_dest_paths.add(dest_path)
+                        # Create each date subdirectory exactly once, before any worker needs it
+                        if dest_subdir not in created_subdirs:
+                            os.makedirs(dest_subdir, exist_ok=True)
+                            created_subdirs.add(dest_subdir)
+                        with progress_lock:
+                            total_new_files += 1
+                        put((entry.path, st, dest_subdir))
+            finally:
+                # One sentinel per worker so they all exit once the queue drains
+                for _ in workers:
+                    work_queue.put(None)
 
-                file_size = os.path.getsize(dest_path)
-                total_size_processed += file_size
-                processed_new_files += 1
+            if args.verbose:
+                logger.info(f"Found {total_source_files} files to process.") # Show total in source
+            logger.info(f"### {total_new_files} new files found ###")
 
-                if ((i + 1) % 10 == 0 or (i + 1) == total_new_files):
-                    action = "Moved" if args.move else "Copied"
-                    logger.info(f"Progress: {processed_new_files}/{total_new_files} files {action} ({total_size_processed / (1024*1024):.2f} MB)")
+            for worker in workers:
+                worker.result()
 
-            except Exception as e:
-                logger.error(f"Error processing {src_path}: {e}")
+        if processed_new_files % 10:
+            logger.info(f"Progress: {processed_new_files}/{total_new_files} files {action} ({total_size_processed / (1024*1024):.2f} MB)")
 
         action_done = "moved" if args.move else "copied"
         logger.info(f"Successfully {action_done} {processed_new_files} new files ({total_size_processed / (1024*1024):.2f} MB) to {DEST_DIR}, organized by date (MM-DD-YYYY).")
         return True, processed_new_files, total_new_files, total_size_processed
     except Exception as e:
         logger.error(f"Error during file processing: {e}")
-        return False, 0, 0, 0
+        if processed_new_files:
+            action_done = "moved" if args.move else "copied"
+            logger.error(f"{processed_new_files} of {total_new_files} new files were {action_done} before the error.")
+        return False, processed_new_files, total_new_files, total_size_processed
 
 def check_mtp_connection():
     """Check if GoPro is connected via MTP using specific GoPro identifiers."""
     try:
-        # Check for GoPro in lsusb output
-        lsusb_result = subprocess.run(['lsusb'], capture_output=True, text=True)
-        for line in lsusb_result.stdout.split('\n'):
-            if GOPRO_VENDOR_ID in line and GOPRO_PRODUCT_ID in line:
-                if args.verbose:
-                    logger.debug(f"GoPro camera found in USB devices (lsusb): {line.strip()}")
-                return True
+        # Check for GoPro among the USB devices known to sysfs
+        if _usb_has(GOPRO_VENDOR_ID, GOPRO_PRODUCT_ID):
+            logger.debug("GoPro camera found in USB devices (sysfs): %s:%s", GOPRO_VENDOR_ID, GOPRO_PRODUCT_ID)
+            return True
         return False
     except Exception as e:
         logger.error(f"Error checking MTP connection: {e}")
         return False
 
+def _poll_for_gopro(deadline):
+    """Check sysfs once per second until the GoPro appears or the deadline passes."""
+    while True:
+        if check_mtp_connection():
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(1, remaining))
+
+def wait_for_gopro(timeout):
+    """Wait up to timeout seconds for the GoPro to appear on the USB bus.
+
+    Uses udev events when pyudev is available, otherwise polls once per second.
+    """
+    deadline = time.monotonic() + timeout
+    # When started by the udev rule the camera is usually already attached
+    if check_mtp_connection():
+        return True
+    if pyudev is None:
+        return _poll_for_gopro(deadline)
+
+    try:
+        context = pyudev.Context()
+        monitor = pyudev.Monitor.from_netlink(context)
+        monitor.filter_by('usb', device_type='usb_device')
+        # Start listening before checking sysfs again so an add event can't slip in between
+        monitor.start()
+    except Exception as e:
+        logger.warning(f"Could not monitor udev events, falling back to polling: {e}")
+        return _poll_for_gopro(deadline)
+
+    if check_mtp_connection():
+        return True
+
+    vendor_id = GOPRO_VENDOR_ID.lower()
+    product_id = GOPRO_PRODUCT_ID.lower()
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        device = monitor.poll(timeout=remaining)
+        if device is None:
+            return False
+        if (device.action == 'add' and
+                (device.properties.get('ID_VENDOR_ID') or '').lower() == vendor_id and
+                (device.properties.get('ID_MODEL_ID') or '').lower() == product_id):
+            logger.debug("GoPro camera added (udev): %s", device.sys_path)
+            return True
+
 def try_access_gopro_mtp():
     """Try to access GoPro via MTP and list its contents using gio mount."""
     try:
-        user_id = os.getuid()
-
         # List currently mounted GVFS mounts
-        gio_list_cmd = "gio mount -l"
-        gio_list_result = subprocess.run(gio_list_cmd, shell=True, capture_output=True, text=True)
-        if args.verbose:
-            logger.debug(f"gio mount -l output:\n{gio_list_result.stdout}")
-        for line in gio_list_result.stdout.split('\n'):
+        gio_list_output = subprocess.run(['gio', 'mount', '-l'], capture_output=True, text=True).stdout
+        logger.debug("gio mount -l output:\n%s", gio_list_output)
+        for line in gio_list_output.split('\n'):
             if "GoPro" in line or GOPRO_VENDOR_ID in line or GOPRO_PRODUCT_ID in line:
                 # Try to find the mount path from the URI
                 match = re.search(r"at (.*)", line)
@@ -310,6 +555,10 @@ def try_access_gopro_mtp():
         # If not found in the list, we might need to explicitly mount it (though usually it auto-mounts)
         # We can't reliably get the MTP URI to mount without it being listed first.
 
+        return None
+    except FileNotFoundError as e:
+        # gio isn't installed; the old shell invocation failed silently here too
+        logger.debug("gio not available: %s", e)
         return None
     except Exception as e:
         logger.error(f"Error accessing GoPro via gio: {e}")
@@ -325,7 +574,7 @@ def main():
     timeout = time.time() + 7  # Set a 7-second timeout
 
     while time.time() < timeout:
-        if check_mtp_connection():
+        if wait_for_gopro(timeout - time.time()):
             if args.verbose:
                 logger.info("GoPro camera detected on USB bus")
 
@@ -348,11 +597,10 @@ def main():
 
                 # Get more device info for debugging
                 device_info = get_device_info()
-                if args.verbose:
-                    logger.debug(f"USB devices: {device_info.get('usb', 'Not available')}")
-                    logger.debug(f"Mount info: {device_info.get('mount', 'Not available')}")
-                    logger.debug(f"GVFS info (gio mount -l): {device_info.get('gvfs_gio', 'Not available')}")
-                    logger.debug(f"GVFS directory contents: {device_info.get('gvfs_list', 'Not available')}")
+                logger.debug("USB devices: %s", device_info.get('usb', 'Not available'))
+                logger.debug("Mount info: %s", device_info.get('mount', 'Not available'))
+                logger.debug("GVFS info (gio mount -l): %s", device_info.get('gvfs_gio', 'Not available'))
+                logger.debug("GVFS directory contents: %s", device_info.get('gvfs_list', 'Not available'))
 
                 # Check if the mount point exists and is readable
                 if os.path.exists(gopro_mount) and os.access(gopro_mount, os.R_OK):
@@ -395,12 +643,14 @@ def main():
                         else:
                             # Send failure notification
                             if not args.no_notify:
-                                send_desktop_notification(
-                                    "Status: Failed", 
-                                    "Progress: 0/0 files processed\n" \
-                                    "Error occurred during file transfer", 
-                                    "dialog-error"
-                                )
+                                if processed_files:
+                                    action_done = "moved" if args.move else "copied"
+                                    body = f"Progress: {processed_files}/{total_files} files {action_done}\n" \
+                                           f"Partially transferred ({total_size / (1024*1024):.2f} MB) before an error occurred"
+                                else:
+                                    body = "Progress: 0/0 files processed\n" \
+                                           "Error occurred during file transfer"
+                                send_desktop_notification("Status: Failed", body, "dialog-error")
                             logger.error("Failed to process files. Exiting with error.")
                             sys.exit(1)
 
@@ -432,8 +682,7 @@ def main():
                 time.sleep(1) # Small delay before next check
         else:
             if args.verbose:
-                logger.info("No GoPro camera detected. Continuing to wait briefly...")
-            time.sleep(1) # Small delay before next check
+                logger.info("No GoPro camera detected before the timeout.")
 
     logger.info("Timeout reached. Exiting.")
     sys.exit(0)